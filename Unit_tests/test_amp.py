@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import pandas as pd
 import Thermobar as pt
 LiqT=pd.DataFrame(data={"SiO2_Liq": 51,
@@ -43,6 +44,49 @@ class test_amp_only_press(unittest.TestCase):
         self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
      equationP="P_Ridolfi2021").P_kbar_calc[0], 4.589114, decimalPlace, "P Rildofi2021 not equal to test value")
 
+    def test_press_ridolfi21_low_total(self):
+        Calcs_R=pt.calculate_amp_only_press(amp_comps=pd.concat([AmpT, AmpT*0.85], ignore_index=True),
+     equationP="P_Ridolfi2021")
+        self.assertAlmostEqual(Calcs_R.P_kbar_calc[0], 4.589114, decimalPlace, "P Rildofi2021 not equal to test value")
+        self.assertTrue(pd.isna(Calcs_R.P_kbar_calc[1]), "P Rildofi2021 with a low total is not NaN")
+        self.assertTrue(pd.isna(Calcs_R.equation[1]), "Rildofi2021 equation with a low total is not missing")
+        self.assertEqual(Calcs_R["Fail Msg"][1], "Cation oxide Total<90", "Rildofi2021 Fail Msg with a low total not equal to test value")
+
+    def test_press_ridolfi12_1a(self):
+        self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
+     equationP="P_Ridolfi2012_1a")[0], 6.146986911577614, decimalPlace, "P Rildofi2012 1a not equal to test value")
+
+    def test_press_ridolfi12_1b(self):
+        self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
+     equationP="P_Ridolfi2012_1b")[0], 4.361368733600545, decimalPlace, "P Rildofi2012 1b not equal to test value")
+
+    def test_press_ridolfi12_1c(self):
+        self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
+     equationP="P_Ridolfi2012_1c")[0], 4.816858492869772, decimalPlace, "P Rildofi2012 1c not equal to test value")
+
+    def test_press_ridolfi12_1d(self):
+        self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
+     equationP="P_Ridolfi2012_1d")[0], 5.799055347293624, decimalPlace, "P Rildofi2012 1d not equal to test value")
+
+    def test_press_ridolfi12_1e(self):
+        self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
+     equationP="P_Ridolfi2012_1e")[0], 7.67238704682107, decimalPlace, "P Rildofi2012 1e not equal to test value")
+
+    def test_press_ridolfi12_matches_equations(self):
+        # calculate_amp_only_press uses a coefficient table for these, check it against each equation
+        cali=pt.return_cali_dataset(model='Ridolfi2021')
+        cat13=pt.calculate_13cations_amphibole_ridolfi(cali)
+        for eq in ["P_Ridolfi2012_1a", "P_Ridolfi2012_1b", "P_Ridolfi2012_1c",
+        "P_Ridolfi2012_1d", "P_Ridolfi2012_1e"]:
+            P_eq=getattr(pt, eq)(Si_Amp_13_cat=cat13['Si_Amp_13_cat'], Ti_Amp_13_cat=cat13['Ti_Amp_13_cat'],
+            Fet_Amp_13_cat=cat13['Fet_Amp_13_cat'], Mg_Amp_13_cat=cat13['Mg_Amp_13_cat'],
+            Ca_Amp_13_cat=cat13['Ca_Amp_13_cat'], K_Amp_13_cat=cat13['K_Amp_13_cat'],
+            Na_Amp_13_cat=cat13['Na_Amp_13_cat'], Al_Amp_13_cat=cat13['Al_Amp_13_cat'])
+            P_calc=pt.calculate_amp_only_press(amp_comps=cali, equationP=eq)
+            for i in range(len(cali)):
+                self.assertAlmostEqual(P_calc[i], P_eq[i], decimalPlace,
+                eq+" from calculate_amp_only_press not equal to the equation")
+
     def test_press_Mutch(self):
         self.assertAlmostEqual(pt.calculate_amp_only_press(amp_comps=AmpT,
      equationP="P_Mutch2016").P_kbar_calc[0], 6.251692054556109, decimalPlace,
@@ -54,6 +98,23 @@ class test_amp_only_press(unittest.TestCase):
      equationP="P_Anderson1995", T=1100)[0], 4.199270205779337,
      decimalPlace, "P Anderson 1995 not equal to test value")
 
+    def test_make_press_Anderson1995(self):
+        self.assertAlmostEqual(pt.make_amp_only_press("P_Anderson1995", T=1100)(AmpT)[0],
+     4.199270205779337, decimalPlace, "P Anderson 1995 from make_amp_only_press not equal to test value")
+
+    def test_press_all_eqs_Al_barometers(self):
+        all_eqs=pt.calculate_amp_only_press_all_eqs(amp_comps=AmpT)
+        for eq in ["P_Hammarstrom1986_eq1", "P_Hammarstrom1986_eq2", "P_Hammarstrom1986_eq3",
+        "P_Hollister1987", "P_Johnson1989", "P_Blundy1990", "P_Schmidt1992"]:
+            self.assertAlmostEqual(all_eqs[eq][0], pt.calculate_amp_only_press(amp_comps=AmpT,
+            equationP=eq)[0], decimalPlace, eq+" in all_eqs not equal to calculate_amp_only_press")
+
+    def test_press_all_eqs_Anderson1995(self):
+        all_eqs=pt.calculate_amp_only_press_all_eqs(amp_comps=AmpT)
+        self.assertAlmostEqual(all_eqs["P_Anderson1995_T_Ridolfi12"][0], pt.calculate_amp_only_press(amp_comps=AmpT,
+        equationP="P_Anderson1995", T=all_eqs["T_Ridolfi12"][0])[0], decimalPlace,
+        "P_Anderson1995_T_Ridolfi12 in all_eqs not equal to calculate_amp_only_press")
+
 class test_amp_only_temp(unittest.TestCase):
     def test_press_eq5(self):
         self.assertAlmostEqual(pt.calculate_amp_only_temp(amp_comps=AmpT,
@@ -65,6 +126,11 @@ class test_amp_only_temp(unittest.TestCase):
      equationT="T_Put2016_eq8", P=6)[0], 1227.6548856, decimalPlace,
      "T eq5 not equal to test value")
 
+    def test_temp_ridolfi12_no_sample_id(self):
+        self.assertAlmostEqual(pt.calculate_amp_only_temp(amp_comps=AmpT.drop(columns='Sample_ID_Amp', errors='ignore'),
+     equationT="T_Ridolfi2012", P=5)[0], 1222.3546318672325, decimalPlace,
+     "T Ridolfi2012 not equal to test value")
+
 class test_amp_press_temp(unittest.TestCase):
     def test_eq5_anderson_press(self):
         self.assertAlmostEqual(pt.calculate_amp_only_press_temp(amp_comps=AmpT,
@@ -92,6 +158,26 @@ class test_amp_liq_temp(unittest.TestCase):
      equationT="T_Put2016_eq4a_amp_sat")[0], 1247.384143,
      decimalPlace, "T from eq4a amp sat is not equal to test value")
 
+    def test_eq4a_amp_sat_float32(self):
+        T_K=pt.calculate_amp_liq_temp(liq_comps=LiqT, amp_comps=AmpT,
+     equationT="T_Put2016_eq4a_amp_sat", dtype=np.float32)
+        self.assertEqual(T_K.dtype, np.float32, "T from eq4a amp sat is not float32")
+        self.assertAlmostEqual(T_K[0], 1247.384143,
+     2, "T from eq4a amp sat in float32 is not equal to test value")
+
+    def test_eq4a_amp_sat_float32_no_Ti(self):
+        T_K=pt.calculate_amp_liq_temp(liq_comps=pd.concat([LiqT, LiqT.assign(TiO2_Liq=0)], ignore_index=True),
+     amp_comps=pd.concat([AmpT, AmpT], ignore_index=True), equationT="T_Put2016_eq4a_amp_sat", dtype=np.float32)
+        self.assertEqual(T_K.dtype, np.float32, "T from eq4a amp sat with no Ti in the liquid is not float32")
+        self.assertAlmostEqual(T_K[0], 1247.384143,
+     2, "T from eq4a amp sat in float32 is not equal to test value")
+        self.assertTrue(T_K.isna()[1], "T from eq4a amp sat with no Ti in the liquid is not NaN")
+
+    def test_eq4a_amp_sat_no_Fe_Mg_Mn(self):
+        self.assertTrue(pt.calculate_amp_liq_temp(liq_comps=LiqT.assign(FeOt_Liq=0, MgO_Liq=0, MnO_Liq=0),
+     amp_comps=AmpT, equationT="T_Put2016_eq4a_amp_sat").isna()[0],
+     "T from eq4a amp sat with no Fe, Mg or Mn in the liquid is not NaN")
+
     def test_eq4b(self):
         self.assertAlmostEqual(pt.calculate_amp_liq_temp(liq_comps=LiqT, amp_comps=AmpT,
      equationT="T_Put2016_eq4b")[0], 1234.702307,
@@ -102,6 +188,15 @@ class test_amp_liq_temp(unittest.TestCase):
     equationT="T_Put2016_eq4b", H2O_Liq=0)[0], 1220.480674,
     decimalPlace, "T from eq4b no H is not equal to test value")
 
+    def test_eq4b_Eq_Putirka(self):
+        self.assertEqual(pt.calculate_amp_liq_temp(liq_comps=LiqT, amp_comps=AmpT,
+     equationT="T_Put2016_eq4b", eq_tests=True).get("Eq Putirka 2016?")[0], "No",
+     "Eq Putirka 2016? not equal to test value")
+
+    def test_eq9_no_K(self):
+        self.assertTrue(pt.calculate_amp_liq_temp(liq_comps=LiqT, amp_comps=AmpT.assign(K2O_Amp=0),
+     equationT="T_Put2016_eq9").isna()[0], "T from eq9 with no K in amphibole is not NaN")
+
 class test_amp_liq_press(unittest.TestCase):
     def test_eq7a_noH(self):
         self.assertAlmostEqual(pt.calculate_amp_liq_press(liq_comps=LiqT,
@@ -124,6 +219,18 @@ class test_amp_liq_press(unittest.TestCase):
      amp_comps=AmpT, equationP="P_Put2016_eq7b", eq_tests=True).get("Kd-Fe-Mg")[0], 0.854897,
      decimalPlace, "Kd Amp-liq not equal to test value")
 
+    def test_eq7a_meltmatch_missing_column(self):
+        meltmatch=pd.concat([pt.calculate_23oxygens_amphibole(amp_comps=AmpT),
+        pt.calculate_hydrous_cat_fractions_liquid(liq_comps=LiqT)], axis=1)
+        with self.assertRaises(KeyError):
+            pt.calculate_amp_liq_press(meltmatch=meltmatch.drop(columns='Na2O_Liq_mol_frac_hyd'),
+            equationP="P_Put2016_eq7a", T=1300)
+
+    def test_eq7b_Eq_Putirka(self):
+        self.assertEqual(pt.calculate_amp_liq_press(liq_comps=LiqT,
+     amp_comps=AmpT, equationP="P_Put2016_eq7b", eq_tests=True).get("Eq Putirka 2016?")[0], "No",
+     "Eq Putirka 2016? not equal to test value")
+
 class test_amp_liq_press_temp(unittest.TestCase):
     def test_eq7a_4b_press(self):
         self.assertAlmostEqual(pt.calculate_amp_liq_press_temp(liq_comps=LiqT,
@@ -135,6 +242,11 @@ class test_amp_liq_press_temp(unittest.TestCase):
      amp_comps=AmpT, equationP="P_Put2016_eq7a", equationT="T_Put2016_eq4b").T_K_calc[0],
       1234.702307, decimalPlace, "P from iterating 7a and 4b not equal to test value")
 
+    def test_eq7a_4b_Eq_Putirka(self):
+        self.assertEqual(pt.calculate_amp_liq_press_temp(liq_comps=LiqT,
+     amp_comps=AmpT, equationP="P_Put2016_eq7a", equationT="T_Put2016_eq4b", eq_tests=True).get("Eq Putirka 2016?")[0],
+      "No", "Eq Putirka 2016? from iterating 7a and 4b not equal to test value")
+
 
 if __name__ == '__main__':
      unittest.main()
\ No newline at end of file
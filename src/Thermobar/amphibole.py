@@ -1,6 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from functools import partial
+from functools import partial, wraps
 import inspect
 import warnings as w
 import numbers
@@ -145,8 +145,9 @@ def P_Anderson1995(T, *, Al_Amp_cat_23ox):
     Amphibole-only (Al) barometer: Anderson and Smith (1995)
     :cite:`hammarstrom1986aluminum`
     '''
-    return (4.76 * Al_Amp_cat_23ox - 3.01 - (((T - 273.15 - 675) / 85)
-            * (0.53 * Al_Amp_cat_23ox + 0.005294 * (T - 273.15 - 675))))
+    T_675 = T - 273.15 - 675
+    return (4.76 * Al_Amp_cat_23ox - 3.01 - ((T_675 / 85)
+            * (0.53 * Al_Amp_cat_23ox + 0.005294 * T_675)))
 
 
 def P_Blundy1990(T=None, *, Al_Amp_cat_23ox):
@@ -230,6 +231,32 @@ def P_Medard2022_MutchSites(T=None,*, amp_comps):
 
 ## Function: Amphibole-only barometry
 
+# 13-cation columns used by all five Ridolfi and Renzulli (2012) equations
+_RIDOLFI_KEYS = ('Si_Amp_13_cat', 'Ti_Amp_13_cat', 'Fet_Amp_13_cat', 'Mg_Amp_13_cat',
+'Ca_Amp_13_cat', 'K_Amp_13_cat', 'Na_Amp_13_cat', 'Al_Amp_13_cat')
+
+# Coefficients of equations 1a, 1b, 1e, 1c and 1d (rows) in the column order of
+# _RIDOLFI_KEYS, these must match P_Ridolfi2012_1a...P_Ridolfi2012_1e above.
+# The exponential equations (1a, 1b, 1e) come first, so they can be
+# exponentiated in place as one contiguous block.
+_RIDOLFI_COEF = np.array([
+    [-9.587571403, -10.11615567, -9.226076274, -8.793390507,
+     -1.6658613, 2.519184959, 2.48347198, -8.173455128],
+    [-2.695663047, -2.35647038717941, -2.7779767369382, -2.48384821395444,
+     -0.661386638563983, 0.111696322092308, -0.270530207793162, -1.30063975020919],
+    [-1.20851740386237, -3.85930939071001, -2.90677947035468, -2.64825741548332,
+     0.513357584438019, 1.81467032749331, 2.9751971464851, -1.10536070667051],
+    [-1925.298250, -1720.63250944418, -1843.19249824537, -1746.94437497404,
+     -158.279055907371, 253.51576430265, -40.4443246813322, -1478.53847391822],
+    [-1991.93398583468, -3034.9724955129, -2454.76485311127, -2125.79095875747,
+     -830.644984403603, 2204.10480275638, 2708.82902160291, -1472.2242262718]])
+_RIDOLFI_INT = np.array([125.9332115, 38.722545085, 26.5426319326957,
+                         24023.367332, 26105.7092067])
+_RIDOLFI_N_EXP = 3
+# Row of _RIDOLFI_COEF for each single equation
+_RIDOLFI2012_ROWS = {'P_Ridolfi2012_1a': 0, 'P_Ridolfi2012_1b': 1, 'P_Ridolfi2012_1e': 2,
+'P_Ridolfi2012_1c': 3, 'P_Ridolfi2012_1d': 4}
+
 Amp_only_P_funcs = { P_Ridolfi2012_1a, P_Ridolfi2012_1b, P_Ridolfi2012_1c, P_Ridolfi2012_1d,
 P_Ridolfi2012_1e, P_Ridolfi2010, P_Hammarstrom1986_eq1, P_Hammarstrom1986_eq2, P_Hammarstrom1986_eq3, P_Hollister1987,
 P_Johnson1989, P_Blundy1990, P_Schmidt1992, P_Anderson1995, P_Kraw2012, P_Medard2022_RidolfiSites,
@@ -237,6 +264,89 @@ P_Medard2022_LeakeSites, P_Medard2022_MutchSites} # put on outside
 
 Amp_only_P_funcs_by_name= {p.__name__: p for p in Amp_only_P_funcs}
 
+
+# T-independent Al-only barometers, evaluated on the same Al array in calculate_amp_only_press_all_eqs
+_AL_BAROMETERS = (P_Hammarstrom1986_eq1, P_Hollister1987, P_Johnson1989,
+P_Blundy1990, P_Schmidt1992, P_Hammarstrom1986_eq2, P_Hammarstrom1986_eq3)
+
+
+def _kwonly_params(func):
+    ''' Returns the names of the keyword-only arguments of func (e.g. the
+    mineral and melt components an equation needs)
+    '''
+    return tuple(name for name, p in inspect.signature(func).parameters.items()
+    if p.kind == inspect.Parameter.KEYWORD_ONLY)
+
+def _solve_kwargs(kwargs):
+    ''' Converts the pandas.Series in kwargs to contiguous float64 numpy
+    arrays, so partial functions returned for "Solve" don't pay pandas
+    overhead each time they are called when iterating P and T, and numpy
+    can use its fast float loops even if the inputs had an object dtype.
+    '''
+    return {name: np.ascontiguousarray(v.to_numpy(dtype=v.dtype if v.dtype.kind == 'f' else float))
+    if isinstance(v, pd.Series) else v for name, v in kwargs.items()}
+
+def _first_column(frames, name):
+    ''' Returns column name from the first of frames that has it, rather than
+    concatenating all the frames just to pull a few columns back out
+    '''
+    for df in frames:
+        if name in df:
+            return df[name]
+    raise KeyError(name)
+
+# Worked out once on import, rather than calling inspect.signature every call
+_AMP_ONLY_P_KWARGS = {name: _kwonly_params(f) for name, f in Amp_only_P_funcs_by_name.items()}
+_AMP_ONLY_P_T_REQUIRED = {name: inspect.signature(f).parameters['T'].default is not None
+for name, f in Amp_only_P_funcs_by_name.items()}
+
+
+# Equations (or combinations of) that the Ridolfi 2021 algorithm can select
+_RIDOLFI2021_EQ_NAMES = ["1a", "1b", "1c", "1d", "1e", "(1b+1c)/2", "(1c+1d)/2", "1c+1d"]
+
+
+def _ridolfi2021_select(P_MPa_1a, P_MPa_1b, P_MPa_1c, P_MPa_1d, P_MPa_1e, Sum_input):
+    '''
+    Selects the pressure (MPa) from equations 1a-1e following the algorithm
+    of Ridolfi (2021). Takes and returns contiguous float64 arrays, along with
+    the code of the equation (or combination of equations) used for each row,
+    which indexes _RIDOLFI2021_EQ_NAMES. Rows with Sum_input<90 are skipped,
+    and returned with a NaN pressure and a code of -1.
+    '''
+    P_MPa_1a, P_MPa_1b, P_MPa_1c, P_MPa_1d, P_MPa_1e, Sum_input = (
+        np.ascontiguousarray(x, dtype=np.float64) for x in
+        (P_MPa_1a, P_MPa_1b, P_MPa_1c, P_MPa_1d, P_MPa_1e, Sum_input))
+
+    P_MPa = np.full(len(Sum_input), np.nan)
+    code = np.full(len(Sum_input), -1, dtype=np.int8)
+    valid = ~(Sum_input < 90)
+    if valid.all():
+        P_1a, P_1b, P_1c, P_1d, P_1e = P_MPa_1a, P_MPa_1b, P_MPa_1c, P_MPa_1d, P_MPa_1e
+    else:
+        P_1a, P_1b, P_1c, P_1d, P_1e = (x[valid] for x in
+        (P_MPa_1a, P_MPa_1b, P_MPa_1c, P_MPa_1d, P_MPa_1e))
+
+    XPae = (P_1a - P_1e) / P_1a
+    deltaPdb = P_1d - P_1b
+
+    # Conditions in the priority order of Ridolfi (2021) - the first
+    # one that is true for a given row selects the equation.
+    conds = [P_1b < 335, P_1b < 399, P_1c < 415,
+             P_1d < 470, XPae > 0.22, deltaPdb > 350,
+             deltaPdb > 210, deltaPdb < 75, XPae < -0.2, XPae > 0.05]
+    choices_P = [P_1b, (P_1b + P_1c) / 2, P_1c,
+                 P_1c, (P_1c + P_1d) / 2, P_1e,
+                 P_1d, P_1c, (P_1b + P_1c) / 2,
+                 (P_1c + P_1d) / 2]
+    # Codes of "1b", "(1b+1c)/2", "1c", "1c", "1c+1d", "1e", "1d", "1c",
+    # "(1b+1c)/2", "(1c+1d)/2"
+    choices_code = [1, 5, 2, 2, 7, 4, 3, 2, 5, 6]
+
+    P_MPa[valid] = np.select(conds, choices_P, default=P_1a)
+    code[valid] = np.select(conds, choices_code, default=0)
+
+    return P_MPa, code
+
 def calculate_amp_only_hygr(amp_comps=None, T=None):
     ''' Exists just to tell users to use a different function
     '''
@@ -282,7 +392,6 @@ def calculate_amp_only_melt_comps(amp_comps=None, T=None):
     + 7.55122550171372*amp_sites_R['Ti_C'] + 5.46318534905121*amp_sites_R['Fe3_C'] -4.73884449358073*amp_sites_R['Mg_C']
         -7.20328571556139*amp_sites_R['Fe2_C']-17.5610110666215*amp_sites_R['Mn_C'] + 13.762022684517*amp_sites_R['Ca_B']
         + 13.7560270877436*amp_sites_R['Na_A']  + 27.5944871599305*amp_sites_R['K_A'])
-    amp_sites.insert(0, "deltaNNO_Ridolfi21", deltaNNO_calc)
 
     # Calculating H2O form Ridofli 2021
 
@@ -290,90 +399,162 @@ def calculate_amp_only_melt_comps(amp_comps=None, T=None):
     + 0.85944576818503*amp_sites_R['Ti_C'] + 1.18881568772057*amp_sites_R['Fe3_C'] -0.675980097369545*amp_sites_R['Mg_C']
         -0.390086849565756*amp_sites_R['Fe2_C']-6.40208103925722*amp_sites_R['Mn_C'] + 2.54899046000297*amp_sites_R['Ca_B']
         + 1.37094801209146*amp_sites_R['Na_A']  + 1.25720999388625*amp_sites_R['K_A']))
-    amp_sites.insert(0, "H2O_Ridolfi21", H2O_calc)
 
 
     if T is None:
         w.warn('You must enter a value for T in Kelvin to get results from equation3 and 5 from Zhang, and SiO2 from Putrka (2016)')
 
-    amp_sites['SiO2_Eq1_Zhang17']=(-736.7170+288.733*np.log(amp_sites['Si_T_ideal'].astype(float))+56.536*amp_sites['Al_VI_C_ideal']
-    +27.169*(amp_sites['Mg_C_ideal']+amp_sites['Mg_B_ideal'])
-+ 62.665*amp_sites['Fe3_C_ideal']+34.814*(amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal'])
-+83.989*(amp_sites['Ti_T_ideal']+amp_sites['Ti_C_ideal'])+44.225*amp_sites['Ca_B_ideal']+14.049*amp_sites['Na_A_ideal'])
+    # Pull out the Zhang site occupancies once, as float arrays
+    Si_T=amp_sites['Si_T_ideal'].to_numpy(dtype=float)
+    Al_VI_C=amp_sites['Al_VI_C_ideal'].to_numpy(dtype=float)
+    Mg_C=amp_sites['Mg_C_ideal'].to_numpy(dtype=float)
+    Fe3_C=amp_sites['Fe3_C_ideal'].to_numpy(dtype=float)
+    Ti_C=amp_sites['Ti_C_ideal'].to_numpy(dtype=float)
+    Ca_B=amp_sites['Ca_B_ideal'].to_numpy(dtype=float)
+    Na_A=amp_sites['Na_A_ideal'].to_numpy(dtype=float)
+    Mg_CB=Mg_C+amp_sites['Mg_B_ideal'].to_numpy(dtype=float)
+    Fe2_CB=amp_sites['Fe2_C_ideal'].to_numpy(dtype=float)+amp_sites['Fe2_B_ideal'].to_numpy(dtype=float)
+    Ti_TC=amp_sites['Ti_T_ideal'].to_numpy(dtype=float)+Ti_C
+    log_Si_T=np.log(Si_T)
 
-    amp_sites['SiO2_Eq2_Zhang17']=(-399.9891 + 212.9463*np.log(amp_sites['Si_T_ideal'].astype(float)) + 11.7464*amp_sites['Al_VI_C_ideal'] +
-    23.5653*amp_sites['Fe3_C_ideal'] + 6.8467*(amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal']) +
-    24.7743*(amp_sites['Ti_T_ideal']+amp_sites['Ti_C_ideal']) + 24.4399 * amp_sites['Ca_B_ideal'])
+    # New columns are collected here, and added to amp_sites in one go at the end
+    melt_comps={}
 
-    amp_sites['SiO2_Eq4_Zhang17']=(-222.614 + 167.517*np.log(amp_sites['Si_T_ideal'].astype(float)) -7.156*(amp_sites['Mg_C_ideal']
-    +amp_sites['Mg_B_ideal']))
+    melt_comps['SiO2_Eq1_Zhang17']=(-736.7170+288.733*log_Si_T+56.536*Al_VI_C
+    +27.169*Mg_CB + 62.665*Fe3_C+34.814*Fe2_CB
+    +83.989*Ti_TC+44.225*Ca_B+14.049*Na_A)
 
-    amp_sites['TiO2_Eq6_Zhang17']=(np.exp(22.4650  -2.5975*amp_sites['Si_T_ideal']
-        -1.15502*amp_sites['Al_VI_C_ideal'] -2.23287*amp_sites['Fe3_C_ideal'] -1.03193*(amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal'])
-        -1.98253*amp_sites['Ca_B_ideal']-1.55912*amp_sites['Na_A_ideal']))
+    melt_comps['SiO2_Eq2_Zhang17']=(-399.9891 + 212.9463*log_Si_T + 11.7464*Al_VI_C +
+    23.5653*Fe3_C + 6.8467*Fe2_CB + 24.7743*Ti_TC + 24.4399 * Ca_B)
 
-    amp_sites['FeO_Eq7_Zhang17']=(np.exp(24.4613  -2.72308*amp_sites['Si_T_ideal']
-        -1.07345*amp_sites['Al_VI_C_ideal'] -1.0466*amp_sites['Fe3_C_ideal'] -0.25801*(amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal'])
-        -1.93601*amp_sites['Ti_C_ideal']-2.52281*amp_sites['Ca_B_ideal']))
+    melt_comps['SiO2_Eq4_Zhang17']=(-222.614 + 167.517*log_Si_T -7.156*Mg_CB)
 
-    amp_sites['FeO_Eq8_Zhang17']=(np.exp(15.6864  -2.09657*amp_sites['Si_T_ideal']
-        +0.36457*amp_sites['Mg_C_ideal'] -1.33131*amp_sites['Ca_B_ideal']))
+    melt_comps['TiO2_Eq6_Zhang17']=(np.exp(22.4650  -2.5975*Si_T
+        -1.15502*Al_VI_C -2.23287*Fe3_C -1.03193*Fe2_CB
+        -1.98253*Ca_B-1.55912*Na_A))
 
-    amp_sites['MgO_Eq9_Zhang17']=(np.exp(12.6618  -2.63189*amp_sites['Si_T_ideal']
-        +1.04995*amp_sites['Al_VI_C_ideal'] +1.26035*amp_sites['Mg_C_ideal']))
+    melt_comps['FeO_Eq7_Zhang17']=(np.exp(24.4613  -2.72308*Si_T
+        -1.07345*Al_VI_C -1.0466*Fe3_C -0.25801*Fe2_CB
+        -1.93601*Ti_C-2.52281*Ca_B))
 
-    amp_sites['CaO_Eq10_Zhang17']=(41.2784  -7.1955*amp_sites['Si_T_ideal']
-        +3.6412*amp_sites['Mg_C_ideal'] -5.0437*amp_sites['Na_A_ideal'])
+    FeO_Eq8=(np.exp(15.6864  -2.09657*Si_T
+        +0.36457*Mg_C -1.33131*Ca_B))
 
-    amp_sites['CaO_Eq11_Zhang17']=np.exp((6.4192  -1.17372*amp_sites['Si_T_ideal']
-        +1.31976*amp_sites['Al_VI_C_ideal'] +0.67733*amp_sites['Mg_C_ideal']))
+    melt_comps['MgO_Eq9_Zhang17']=(np.exp(12.6618  -2.63189*Si_T
+        +1.04995*Al_VI_C +1.26035*Mg_C))
 
-    amp_sites['K2O_Eq12_Zhang17']=(100.5909  -4.3246*amp_sites['Si_T_ideal']
-        -17.8256*amp_sites['Al_VI_C_ideal']-10.0901*amp_sites['Mg_C_ideal'] -15.683*amp_sites['Fe3_C_ideal']
-        -8.8004*(amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal'])-19.7448*amp_sites['Ti_C_ideal']
-        -6.3727*amp_sites['Ca_B_ideal']-5.8069*amp_sites['Na_A_ideal'])
+    melt_comps['CaO_Eq10_Zhang17']=(41.2784  -7.1955*Si_T
+        +3.6412*Mg_C -5.0437*Na_A)
 
-    amp_sites['K2O_Eq13_Zhang17']=(-16.53  +1.6878*amp_sites['Si_T_ideal']
-        +1.2354*(amp_sites['Fe3_C_ideal']+amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal'])
-        +5.0404*amp_sites['Ti_C_ideal']+2.9703*amp_sites['Ca_B_ideal'])
+    melt_comps['CaO_Eq11_Zhang17']=np.exp((6.4192  -1.17372*Si_T
+        +1.31976*Al_VI_C +0.67733*Mg_C))
 
-    amp_sites['Al2O3_Eq14_Zhang17']=(4.573 + 6.9408*amp_sites['Al_VI_C_ideal']+1.0059*amp_sites['Mg_C_ideal']
-        +4.5448*amp_sites['Fe3_C_ideal']+5.9679*amp_sites['Ti_C_ideal']
-        +7.1501*amp_sites['Na_A_ideal'])
+    melt_comps['K2O_Eq12_Zhang17']=(100.5909  -4.3246*Si_T
+        -17.8256*Al_VI_C-10.0901*Mg_C -15.683*Fe3_C
+        -8.8004*Fe2_CB-19.7448*Ti_C
+        -6.3727*Ca_B-5.8069*Na_A)
 
-    cols_to_move = ['SiO2_Eq1_Zhang17', 'SiO2_Eq2_Zhang17', "SiO2_Eq4_Zhang17", "TiO2_Eq6_Zhang17",
-                    'FeO_Eq7_Zhang17', 'MgO_Eq9_Zhang17', 'CaO_Eq10_Zhang17', 'CaO_Eq11_Zhang17', 'K2O_Eq12_Zhang17',
-                        'K2O_Eq13_Zhang17', 'Al2O3_Eq14_Zhang17']
-    amp_sites= amp_sites[cols_to_move +
-                                    [col for col in amp_sites.columns if col not in cols_to_move]]
+    melt_comps['K2O_Eq13_Zhang17']=(-16.53  +1.6878*Si_T
+        +1.2354*(Fe3_C+Fe2_CB)
+        +5.0404*Ti_C+2.9703*Ca_B)
 
+    melt_comps['Al2O3_Eq14_Zhang17']=(4.573 + 6.9408*Al_VI_C+1.0059*Mg_C
+        +4.5448*Fe3_C+5.9679*Ti_C
+        +7.1501*Na_A)
 
     if T is not None:
-        SiO2_Eq3=(-228 + 0.01065*(T-273.15) + 165*np.log(amp_sites['Si_T_ideal'].astype(float))
-        -7.219*(amp_sites['Mg_C_ideal']+amp_sites['Mg_B_ideal']))
-        amp_sites.insert(4, "SiO2_Eq3_Zhang17", SiO2_Eq3)
-
-        TiO2_Eq5=(np.exp( 23.4870 -0.0011*(T-273.15) +-2.5692*amp_sites['Si_T_ideal']
-        -1.3919*amp_sites['Al_VI_C_ideal'] -2.1195361*amp_sites['Fe3_C_ideal'] -1.0510775*(amp_sites['Fe2_C_ideal']+amp_sites['Fe2_B_ideal'])
-        -2.0634034*amp_sites['Ca_B_ideal']-1.5960633*amp_sites['Na_A_ideal']))
-        amp_sites.insert(6, "TiO2_Eq5_Zhang17", TiO2_Eq5)
-
         # Putirka 2016 equation 10
         SiO2_Put2016=751.95-0.4*(T-273.15)-278000/(T-273.15)-9.184*amp_23ox['Al_Amp_cat_23ox']
-        amp_sites.insert(0, 'SiO2_Eq10_Put2016', SiO2_Put2016)
 
+        SiO2_Eq3=(-228 + 0.01065*(T-273.15) + 165*log_Si_T
+        -7.219*Mg_CB)
+
+        TiO2_Eq5=(np.exp( 23.4870 -0.0011*(T-273.15) +-2.5692*Si_T
+        -1.3919*Al_VI_C -2.1195361*Fe3_C -1.0510775*Fe2_CB
+        -2.0634034*Ca_B-1.5960633*Na_A))
 
+        cols_order=['SiO2_Eq10_Put2016', 'SiO2_Eq1_Zhang17', 'SiO2_Eq2_Zhang17', "SiO2_Eq4_Zhang17",
+                    "TiO2_Eq6_Zhang17", "SiO2_Eq3_Zhang17", 'FeO_Eq7_Zhang17', "TiO2_Eq5_Zhang17"]
+        melt_comps['SiO2_Eq10_Put2016']=SiO2_Put2016
+        melt_comps['SiO2_Eq3_Zhang17']=SiO2_Eq3
+        melt_comps['TiO2_Eq5_Zhang17']=TiO2_Eq5
+    else:
+        cols_order=['SiO2_Eq1_Zhang17', 'SiO2_Eq2_Zhang17', "SiO2_Eq4_Zhang17",
+                    "TiO2_Eq6_Zhang17", 'FeO_Eq7_Zhang17']
+
+    melt_comps['H2O_Ridolfi21']=H2O_calc
+    melt_comps['deltaNNO_Ridolfi21']=deltaNNO_calc
+    cols_order=cols_order+['MgO_Eq9_Zhang17', 'CaO_Eq10_Zhang17', 'CaO_Eq11_Zhang17', 'K2O_Eq12_Zhang17',
+                        'K2O_Eq13_Zhang17', 'Al2O3_Eq14_Zhang17', 'H2O_Ridolfi21', 'deltaNNO_Ridolfi21']
+    melt_comps=pd.DataFrame({col: melt_comps[col] for col in cols_order}, index=amp_sites.index)
 
+    amp_sites=pd.concat([melt_comps, amp_sites,
+    pd.DataFrame({'FeO_Eq8_Zhang17': FeO_Eq8}, index=amp_sites.index)], axis=1)
 
     return amp_sites
 
 
 
+def make_amp_only_press(equationP, T=None):
+    """
+    Resolves an amphibole-only barometer once, and returns a function that
+    only takes amp_comps. Useful when the same equation is applied
+    many times (e.g. Monte Carlo error propagation), as the equation lookup,
+    input checks, and argument names are not worked out again on each call.
+
+    Parameters
+    -----------
+
+    equationP: str
+        Any equation supported by calculate_amp_only_press, except
+        P_Ridolfi2021, P_Ridolfi2012_1a-e, P_Mutch2016 and P_Kraw2012,
+        which have their own site/filter calculations.
+
+    T: float, int, pandas.Series, str  ("Solve")
+        Temperature in Kelvin, only needed for T-sensitive barometers.
+
+    Returns
+    -------
+    function
+        Takes amp_comps (pandas.DataFrame), returns pressure in kbar
+        (or a partial function if T="Solve").
+    """
+    if equationP in ("P_Ridolfi2021", "P_Mutch2016", "P_Kraw2012") or 'Ridolfi2012' in equationP:
+        raise ValueError(f'{equationP} is not supported by make_amp_only_press,'
+        ' use calculate_amp_only_press instead')
+    try:
+        func = Amp_only_P_funcs_by_name[equationP]
+    except KeyError:
+        raise ValueError(f'{equationP} is not a valid equation') from None
+
+    if _AMP_ONLY_P_T_REQUIRED[equationP] and T is None:
+        raise ValueError(f'{equationP} requires you to enter T, or specify T="Solve"')
+
+    keys = _AMP_ONLY_P_KWARGS[equationP]
+    # The Medard 2022 equations work out their own sites from the oxides
+    uses_amp_comps = keys == ('amp_comps',)
+
+    def _fast(amp_comps):
+        if uses_amp_comps:
+            kwargs = {'amp_comps': amp_comps}
+        else:
+            ox23_amp = calculate_23oxygens_amphibole(amp_comps=amp_comps)
+            kwargs = {name: ox23_amp[name] for name in keys}
+        if T is None:
+            return func(**kwargs)
+        if isinstance(T, str) and T == "Solve":
+            return partial(func, **_solve_kwargs(kwargs))
+        return func(T, **kwargs)
+
+    return _fast
+
+
 def calculate_amp_only_press(amp_comps=None, equationP=None, T=None, deltaNNO=None,
 classification=False, Ridolfi_Filter=True):
 
     """
-    Amphibole-only barometry, returns pressure in kbar.
+    Amphibole-only barometry, returns pressure in kbar. For repeated calls
+    with the same equation, see make_amp_only_press.
 
     Parameters
     -----------
@@ -421,9 +602,8 @@ classification=False, Ridolfi_Filter=True):
             func = Amp_only_P_funcs_by_name[equationP]
         except KeyError:
             raise ValueError(f'{equationP} is not a valid equation') from None
-        sig=inspect.signature(func)
 
-        if sig.parameters['T'].default is not None:
+        if _AMP_ONLY_P_T_REQUIRED[equationP]:
             if T is None:
                 raise ValueError(f'{equationP} requires you to enter T, or specify T="Solve"')
         else:
@@ -460,11 +640,13 @@ classification=False, Ridolfi_Filter=True):
         ' sample suite. Note, if there is CO2 in the system P=/ PH2O')
         if deltaNNO is None:
             raise ValueError('P_Kraw2012 requires you to enter a deltaNNO value')
-        Mgno_Amp=100*(amp_comps['MgO_Amp']/40.3044)/((amp_comps['MgO_Amp']/40.3044)+(amp_comps['FeOt_Amp']/71.844))
+        Mg_Amp=amp_comps['MgO_Amp'].to_numpy(dtype=float)/40.3044
+        Fe_Amp=amp_comps['FeOt_Amp'].to_numpy(dtype=float)/71.844
+        Mgno_Amp=100*Mg_Amp/(Mg_Amp+Fe_Amp)
         P_kbar=P_Kraw2012(Mgno_Amp=Mgno_Amp,
         deltaNNO=deltaNNO)
         df_out=pd.DataFrame(data={'PH2O_kbar_calc': P_kbar,
-        'Mg#_Amp': Mgno_Amp})
+        'Mg#_Amp': Mgno_Amp}, index=amp_comps.index)
         return df_out
 
 
@@ -488,117 +670,16 @@ classification=False, Ridolfi_Filter=True):
             final_cat.insert(1, "classification", name)
         return final_cat
 
-    if 'Ridolfi2012' in equationP or equationP == "P_Ridolfi2021":
-
-        cat13 = calculate_sites_ridolfi(amp_comps)
-        Sum_input=cat13['Sum_input']
-
-
-        kwargs_1a = {name: cat13[name] for name, p in inspect.signature(
-            P_Ridolfi2012_1a).parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
-        kwargs_1b = {name: cat13[name] for name, p in inspect.signature(
-            P_Ridolfi2012_1b).parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
-        kwargs_1c = {name: cat13[name] for name, p in inspect.signature(
-            P_Ridolfi2012_1c).parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
-        kwargs_1d = {name: cat13[name] for name, p in inspect.signature(
-            P_Ridolfi2012_1d).parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
-        kwargs_1e = {name: cat13[name] for name, p in inspect.signature(
-            P_Ridolfi2012_1e).parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
-
-        P_MPa_1a = 100 * partial(P_Ridolfi2012_1a, **kwargs_1a)(0)
-        P_MPa_1b = 100 * partial(P_Ridolfi2012_1b, **kwargs_1b)(0)
-        P_MPa_1c = 100 * partial(P_Ridolfi2012_1c, **kwargs_1c)(0)
-        P_MPa_1d = 100 * partial(P_Ridolfi2012_1d, **kwargs_1d)(0)
-        P_MPa_1e = 100 * partial(P_Ridolfi2012_1e, **kwargs_1e)(0)
-
-        if equationP == "P_Ridolfi2021":
-
-
-            XPae = (P_MPa_1a - P_MPa_1e) / P_MPa_1a
-            deltaPdb = P_MPa_1d - P_MPa_1b
-
-            P_MPa = np.empty(len(P_MPa_1a))
-            name=np.empty(len(P_MPa_1a), dtype=np.dtype('U100'))
-            for i in range(0, len(P_MPa_1a)):
-                if P_MPa_1b[i] < 335:
-                    P_MPa[i] = P_MPa_1b[i]
-                    name[i]="1b"
-                elif P_MPa_1b[i] < 399:
-                    P_MPa[i] = (P_MPa_1b[i] + P_MPa_1c[i]) / 2
-                    name[i]="(1b+1c)/2"
-                elif P_MPa_1c[i] < 415:
-                    P_MPa[i] = (P_MPa_1c[i])
-                    name[i]="1c"
-                elif P_MPa_1d[i] < 470:
-                    P_MPa[i] = (P_MPa_1c[i])
-                    name[i]="1c"
-                elif XPae[i] > 0.22:
-                    P_MPa[i] = (P_MPa_1c[i] + P_MPa_1d[i]) / 2
-                    name[i]="1c+1d"
-                elif deltaPdb[i] > 350:
-                    P_MPa[i] = P_MPa_1e[i]
-                    name[i]="1e"
-                elif deltaPdb[i] > 210:
-                    P_MPa[i] = P_MPa_1d[i]
-                    name[i]="1d"
-                elif deltaPdb[i] < 75:
-                    P_MPa[i] = P_MPa_1c[i]
-                    name[i]="1c"
-                elif XPae[i] < -0.2:
-                    P_MPa[i] = (P_MPa_1b[i] + P_MPa_1c[i]) / 2
-                    name[i]="(1b+1c)/2"
-                elif XPae[i] > 0.05:
-                    P_MPa[i] = (P_MPa_1c[i] + P_MPa_1d[i]) / 2
-                    name[i]="(1c+1d)/2"
-                else:
-                    P_MPa[i] = P_MPa_1a[i]
-                    name[i]="1a"
-
-                if Sum_input[i] < 90:
-                    P_MPa[i] = np.nan
-
-
-            Calcs_R=cat13.copy()
-            Calcs_R['P_kbar_calc']=P_MPa / 100
-            Calcs_R['equation']=name
-            Calcs_R['Sum_input']=Sum_input
-            Low_sum=Sum_input<90
-
-            Calcs_R['APE']=np.abs(P_MPa_1a-P_MPa)/(P_MPa_1a+P_MPa)*200
-            High_APE=Calcs_R['APE']>60
-            Calcs_R.loc[(High_APE), 'Input_Check']=False
-            Calcs_R.loc[(High_APE), 'Fail Msg']="APE >60"
-
-            if Ridolfi_Filter is True:
-                Failed_input=Calcs_R['Input_Check']==False
-                Calcs_R.loc[Failed_input, 'P_kbar_calc']=np.nan
-
-            cols_to_move = ['P_kbar_calc', 'Input_Check', "Fail Msg", "classification",
-                            'equation', 'H2O_calc', 'Fe2O3_calc', 'FeO_calc', 'Total_recalc', 'Sum_input']
-            Calcs_R= Calcs_R[cols_to_move +
-                                            [col for col in Calcs_R.columns if col not in cols_to_move]]
-
-
-            return Calcs_R # was P_kbar
-
-        if equationP == "P_Ridolfi2012_1a":
-            P_kbar = P_MPa_1a / 100
-
-
-        if equationP == "P_Ridolfi2012_1b":
-            P_kbar = P_MPa_1b / 100
-
-
-        if equationP == "P_Ridolfi2012_1c":
-            P_kbar = P_MPa_1c / 100
-
-
-        if equationP == "P_Ridolfi2012_1d":
-            P_kbar = P_MPa_1d / 100
-
-
-        if equationP == "P_Ridolfi2012_1e":
-            P_kbar = P_MPa_1e / 100
+    if equationP in _RIDOLFI2012_ROWS:
+        # Single equation, only needs the 13 cation normalization and one
+        # row of coefficients, not the site allocation and input checks
+        cat13 = calculate_13cations_amphibole_ridolfi(amp_comps)
+        row = _RIDOLFI2012_ROWS[equationP]
+        X = np.column_stack([cat13[name].to_numpy() for name in _RIDOLFI_KEYS])
+        L = X @ _RIDOLFI_COEF[row] + _RIDOLFI_INT[row]
+        if row < _RIDOLFI_N_EXP:
+            L = np.exp(L)
+        P_kbar = pd.Series(L / 100, index=cat13.index)
 
         if classification is False:
             return P_kbar
@@ -607,22 +688,51 @@ classification=False, Ridolfi_Filter=True):
             p_name=pd.DataFrame(data={"P_kbar_calc": P_kbar, "classification":name})
             return p_name
 
+    if equationP == "P_Ridolfi2021":
 
+        cat13 = calculate_sites_ridolfi(amp_comps)
+        Sum_input=cat13['Sum_input']
 
 
+        # All five equations in one pass, P in MPa is 100*0.01*L
+        # L has one row per equation, so each equation is contiguous in memory
+        X = np.column_stack([cat13[name].to_numpy() for name in _RIDOLFI_KEYS])
+        L = _RIDOLFI_COEF @ X.T + _RIDOLFI_INT[:, None]
+        np.exp(L[:_RIDOLFI_N_EXP], out=L[:_RIDOLFI_N_EXP])
+        P_MPa_1a, P_MPa_1b, P_MPa_1e, P_MPa_1c, P_MPa_1d = L
 
-    if equationP != "Mutch2016" and 'Ridolfi2012' not in equationP and  equationP != "P_Ridolfi2021":
-        ox23_amp = calculate_23oxygens_amphibole(amp_comps=amp_comps)
+        P_MPa, eq_code = _ridolfi2021_select(P_MPa_1a, P_MPa_1b, P_MPa_1c,
+            P_MPa_1d, P_MPa_1e, Sum_input.to_numpy())
 
-    kwargs = {name: ox23_amp[name] for name, p in sig.parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
-    if isinstance(T, str) or T is None:
-        if T == "Solve":
-            P_kbar = partial(func, **kwargs)
-        if T is None:
-            P_kbar=func(**kwargs)
 
-    else:
-        P_kbar=func(T, **kwargs)
+        APE=np.abs(P_MPa_1a-P_MPa)/(P_MPa_1a+P_MPa)*200
+        High_APE=APE>60
+        Input_Check=cat13['Input_Check'].to_numpy(dtype=bool) & ~High_APE
+        Fail_Msg=cat13['Fail Msg'].mask(High_APE, "APE >60")
+
+        P_kbar=P_MPa / 100
+        if Ridolfi_Filter is True:
+            P_kbar=np.where(Input_Check, P_kbar, np.nan)
+
+        # Main outputs first, then the rest of the site calculations, then APE.
+        # Rows skipped for low totals have code -1, so are missing in equation
+        Calcs_main=pd.DataFrame(data={'P_kbar_calc': P_kbar,
+        'Input_Check': Input_Check, "Fail Msg": Fail_Msg,
+        "classification": cat13['classification'],
+        'equation': pd.Categorical.from_codes(eq_code, categories=_RIDOLFI2021_EQ_NAMES),
+        'H2O_calc': cat13['H2O_calc'], 'Fe2O3_calc': cat13['Fe2O3_calc'],
+        'FeO_calc': cat13['FeO_calc'], 'Total_recalc': cat13['Total_recalc'],
+        'Sum_input': Sum_input}, index=cat13.index)
+
+        Calcs_R=pd.concat([Calcs_main,
+        cat13.drop(columns=[col for col in Calcs_main.columns if col in cat13.columns]),
+        pd.DataFrame(data={'APE': APE}, index=cat13.index)], axis=1)
+
+
+        return Calcs_R # was P_kbar
+
+    # Remaining equations just need cations on the basis of 23 oxygens
+    P_kbar = make_amp_only_press(equationP, T=T)(amp_comps)
 
     if classification is False:
         return P_kbar
@@ -643,6 +753,12 @@ def calculate_amp_only_press_all_eqs(amp_comps, plot=False, H2O_Liq=None, Ridolf
         equationP="P_Ridolfi2021", equationT="T_Ridolfi2012", Ridolfi_Filter=Ridolfi_Filter).T_K_calc
         amp_calcs["P_Ridolfi21"]=amp_calcs['P_kbar_calc']
         amp_calcs["T_Ridolfi12"]=T_calc
+
+        # Al-only barometers, all evaluated on the 23 oxygen Al
+        Al=calculate_23oxygens_amphibole(amp_comps=amp_comps_c)['Al_Amp_cat_23ox'].to_numpy(dtype=float)
+        for func in _AL_BAROMETERS:
+            amp_calcs[func.__name__]=func(Al_Amp_cat_23ox=Al)
+        amp_calcs['P_Anderson1995_T_Ridolfi12']=P_Anderson1995(T_calc.to_numpy(dtype=float), Al_Amp_cat_23ox=Al)
         X_Ridolfi21_Sorted=np.sort(amp_calcs['P_Ridolfi21'])
         if plot==True:
             plt.step(np.concatenate([X_Ridolfi21_Sorted, X_Ridolfi21_Sorted[[-1]]]),
@@ -746,6 +862,48 @@ def T_Put2016_eq8(P, *, Si_Amp_cat_23ox, Ti_Amp_cat_23ox,
             72.85 * Mg_Amp_cat_23ox + 88.9 * Na_Amp_cat_23ox + 40.65 * P / 10)
 ## Equations: Amphibole-Liquid barometers
 
+def _as_float(x):
+    ''' Returns x as floats, so logs can be taken of columns with object dtype.
+    pandas.Series and numpy arrays stay as they are, and single values
+    become a float, so the equations can also be evaluated on one sample
+    without the overhead of length-1 arrays.
+    '''
+    if isinstance(x, (pd.Series, np.ndarray)):
+        # Float inputs keep their precision (e.g. if dtype=np.float32 was chosen)
+        return x if x.dtype.kind == 'f' else x.astype(float)
+    return float(x)
+
+
+def _nan_unless_positive(*names):
+    ''' Decorator for equations that take logs of the components in names.
+    The equation is only evaluated on the rows where all of these are >0,
+    and returns NaN for the other rows, rather than taking logs of zero.
+    A tuple of names is checked on the sum of those components, for logs
+    of a sum (e.g. FeOt+MgO+MnO). Array-like positional arguments (e.g. P
+    or T from the P-T iteration) are subset to the same rows.
+    '''
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            valid = np.logical_and.reduce(np.broadcast_arrays(
+                *(sum(np.asarray(kwargs[n]) for n in name) > 0 if isinstance(name, tuple)
+                else np.asarray(kwargs[name]) > 0 for name in names)))
+            if np.all(valid):
+                return func(*args, **kwargs)
+            if np.ndim(valid) == 0:
+                return np.nan
+
+            res = np.asarray(func(*(x[valid] if np.ndim(x) else x for x in args),
+            **{name: x[valid] if np.ndim(x) else x for name, x in kwargs.items()}))
+            # Keeps the precision of the valid rows (e.g. float32), rather than float64
+            out = np.full(len(valid), np.nan, dtype=res.dtype)
+            out[valid] = res
+            index = next((x.index for x in kwargs.values() if isinstance(x, pd.Series)), None)
+            return out if index is None else pd.Series(out, index=index)
+        return wrapper
+    return decorator
+
+
 def P_Put2016_eq7a(T=None, *, Al_Amp_cat_23ox, Na_Amp_cat_23ox,
 K_Amp_cat_23ox, Al2O3_Liq_mol_frac_hyd, Na2O_Liq_mol_frac_hyd,
 H2O_Liq_mol_frac_hyd, P2O5_Liq_mol_frac_hyd):
@@ -756,10 +914,11 @@ H2O_Liq_mol_frac_hyd, P2O5_Liq_mol_frac_hyd):
 
     '''
     # print('Note - Putirka 2016 spreadsheet calculates H2O using a H2O-solubility law of uncertian origin based on the pressure calculated for 7a, and iterates H"O and P. We dont do this, as we dont believe a pure h2o model is necessarily valid as you may be mixed fluid saturated or undersaturated. We recomend instead you choose a reasonable H2O content based on your system.')
-    return (10 * (-3.093 - 4.274 * np.log(Al_Amp_cat_23ox.astype(float) / Al2O3_Liq_mol_frac_hyd.astype(float))
-    - 4.216 * np.log(Al2O3_Liq_mol_frac_hyd.astype(float)) + 63.3 * P2O5_Liq_mol_frac_hyd +
+    Al2O3_Liq = _as_float(Al2O3_Liq_mol_frac_hyd)
+    return (10 * (-3.093 - 4.274 * np.log(_as_float(Al_Amp_cat_23ox) / Al2O3_Liq)
+    - 4.216 * np.log(Al2O3_Liq) + 63.3 * P2O5_Liq_mol_frac_hyd +
     1.264 * H2O_Liq_mol_frac_hyd + 2.457 * Al_Amp_cat_23ox + 1.86 * K_Amp_cat_23ox
-    + 0.4 * np.log(Na_Amp_cat_23ox.astype(float) / Na2O_Liq_mol_frac_hyd.astype(float))))
+    + 0.4 * np.log(_as_float(Na_Amp_cat_23ox) / _as_float(Na2O_Liq_mol_frac_hyd))))
 
 
 def P_Put2016_eq7b(T=None, *, Al2O3_Liq_mol_frac_hyd, P2O5_Liq_mol_frac_hyd, Al_Amp_cat_23ox,
@@ -770,11 +929,12 @@ def P_Put2016_eq7b(T=None, *, Al2O3_Liq_mol_frac_hyd, P2O5_Liq_mol_frac_hyd, Al_
     :cite:``
 
     '''
-    return (-64.79 - 6.064 * np.log(Al_Amp_cat_23ox.astype(float) / Al2O3_Liq_mol_frac_hyd.astype(float))
-    + 61.75 * SiO2_Liq_mol_frac_hyd + 682 * P2O5_Liq_mol_frac_hyd
+    SiO2_Liq = _as_float(SiO2_Liq_mol_frac_hyd)
+    return (-64.79 - 6.064 * np.log(_as_float(Al_Amp_cat_23ox) / _as_float(Al2O3_Liq_mol_frac_hyd))
+    + 61.75 * SiO2_Liq + 682 * P2O5_Liq_mol_frac_hyd
     - 101.9 *CaO_Liq_mol_frac_hyd + 7.85 * Al_Amp_cat_23ox
-    - 46.46 * np.log(SiO2_Liq_mol_frac_hyd.astype(float))
-    - 4.81 * np.log(Na2O_Liq_mol_frac_hyd.astype(float) + K2O_Liq_mol_frac_hyd.astype(float)))
+    - 46.46 * np.log(SiO2_Liq)
+    - 4.81 * np.log(_as_float(Na2O_Liq_mol_frac_hyd) + _as_float(K2O_Liq_mol_frac_hyd)))
 
 
 def P_Put2016_eq7c(T=None, *, Al_Amp_cat_23ox, K_Amp_cat_23ox,
@@ -784,10 +944,11 @@ def P_Put2016_eq7c(T=None, *, Al_Amp_cat_23ox, K_Amp_cat_23ox,
     :cite:`putirka2016amphibole`
 
     '''
+    Al2O3_Liq = _as_float(Al2O3_Liq_mol_frac)
     return (-45.55 + 26.65 * Al_Amp_cat_23ox + 22.52 * K_Amp_cat_23ox
-    + 439 * P2O5_Liq_mol_frac - 51.1 * np.log(Al2O3_Liq_mol_frac.astype(float)) -
-    46.3 * np.log(Al_Amp_cat_23ox.astype(float) / (Al2O3_Liq_mol_frac.astype(float)))
-    + 5.231 * np.log(Na_Amp_cat_23ox.astype(float) / (Na2O_Liq_mol_frac.astype(float))))
+    + 439 * P2O5_Liq_mol_frac - 51.1 * np.log(Al2O3_Liq) -
+    46.3 * np.log(_as_float(Al_Amp_cat_23ox) / Al2O3_Liq)
+    + 5.231 * np.log(_as_float(Na_Amp_cat_23ox) / (_as_float(Na2O_Liq_mol_frac))))
 
 ## Equations: Amphibole-Liquid thermometers
 
@@ -800,12 +961,15 @@ def T_Put2016_eq4b(P=None, *, H2O_Liq_mol_frac_hyd, Fet_Amp_cat_23ox, FeOt_Liq_m
 
     '''
     return (273.15 + (8037.85 / (3.69 - 2.62 * H2O_Liq_mol_frac_hyd + 0.66 * Fet_Amp_cat_23ox
-    - 0.416 * np.log(TiO2_Liq_mol_frac_hyd.astype(float)) + 0.37 * np.log(MgO_Liq_mol_frac_hyd.astype(float))
-    -1.05 * np.log((FeOt_Liq_mol_frac_hyd.astype(float) + MgO_Liq_mol_frac_hyd.astype(float)
-    + MnO_Liq_mol_frac_hyd.astype(float)) * Al2O3_Liq_mol_frac_hyd)
-    - 0.462 * np.log(Ti_Amp_cat_23ox.astype(float) / TiO2_Liq_mol_frac_hyd.astype(float)))))
+    - 0.416 * np.log(_as_float(TiO2_Liq_mol_frac_hyd)) + 0.37 * np.log(_as_float(MgO_Liq_mol_frac_hyd))
+    -1.05 * np.log((_as_float(FeOt_Liq_mol_frac_hyd) + _as_float(MgO_Liq_mol_frac_hyd)
+    + _as_float(MnO_Liq_mol_frac_hyd)) * Al2O3_Liq_mol_frac_hyd)
+    - 0.462 * np.log(_as_float(Ti_Amp_cat_23ox) / _as_float(TiO2_Liq_mol_frac_hyd)))))
 
 
+@_nan_unless_positive('TiO2_Liq_mol_frac_hyd', 'Al2O3_Liq_mol_frac_hyd',
+'Na2O_Liq_mol_frac_hyd', 'Na_Amp_cat_23ox',
+('FeOt_Liq_mol_frac_hyd', 'MgO_Liq_mol_frac_hyd', 'MnO_Liq_mol_frac_hyd'))
 def T_Put2016_eq4a_amp_sat(P=None, *, FeOt_Liq_mol_frac_hyd, TiO2_Liq_mol_frac_hyd, Al2O3_Liq_mol_frac_hyd,
                            MnO_Liq_mol_frac_hyd, MgO_Liq_mol_frac_hyd, Na_Amp_cat_23ox, Na2O_Liq_mol_frac_hyd):
     '''
@@ -813,13 +977,20 @@ def T_Put2016_eq4a_amp_sat(P=None, *, FeOt_Liq_mol_frac_hyd, TiO2_Liq_mol_frac_h
     :cite:`putirka2016amphibole`
 
     '''
+    # Logs used more than once, log(a*b)=log(a)+log(b) and log(a/b)=log(a)-log(b)
+    log_Al_Liq = np.log(_as_float(Al2O3_Liq_mol_frac_hyd))
+    log_Na_Liq = np.log(_as_float(Na2O_Liq_mol_frac_hyd))
+    log_FMM_Liq = np.log(_as_float(FeOt_Liq_mol_frac_hyd)
+    + _as_float(MgO_Liq_mol_frac_hyd) + _as_float(MnO_Liq_mol_frac_hyd))
+
     return (273.15 + (6383.4 / (-12.07 + 45.4 * Al2O3_Liq_mol_frac_hyd + 12.21 * FeOt_Liq_mol_frac_hyd -
-    0.415 * np.log(TiO2_Liq_mol_frac_hyd.astype(float)) - 3.555 * np.log(Al2O3_Liq_mol_frac_hyd.astype(float))
-     - 0.832 * np.log(Na2O_Liq_mol_frac_hyd.astype(float)) -0.481 * np.log((FeOt_Liq_mol_frac_hyd.astype(float)
-     + MgO_Liq_mol_frac_hyd.astype(float) + MnO_Liq_mol_frac_hyd.astype(float)) * Al2O3_Liq_mol_frac_hyd.astype(float))
-     - 0.679 * np.log(Na_Amp_cat_23ox.astype(float) / Na2O_Liq_mol_frac_hyd.astype(float)))))
+    0.415 * np.log(_as_float(TiO2_Liq_mol_frac_hyd)) - 3.555 * log_Al_Liq
+     - 0.832 * log_Na_Liq - 0.481 * (log_FMM_Liq + log_Al_Liq)
+     - 0.679 * (np.log(_as_float(Na_Amp_cat_23ox)) - log_Na_Liq))))
 
 
+@_nan_unless_positive('FeOt_Liq_mol_frac_hyd', 'Al_Amp_cat_23ox', 'Al2O3_Liq_mol_frac_hyd',
+'K_Amp_cat_23ox', 'Na2O_Liq_mol_frac_hyd', 'K2O_Liq_mol_frac_hyd')
 def T_Put2016_eq9(P=None, *, Si_Amp_cat_23ox, Ti_Amp_cat_23ox, Mg_Amp_cat_23ox,
 Fet_Amp_cat_23ox, Na_Amp_cat_23ox,  FeOt_Liq_mol_frac_hyd, Al_Amp_cat_23ox, Al2O3_Liq_mol_frac_hyd,
 K_Amp_cat_23ox, Ca_Amp_cat_23ox, Na2O_Liq_mol_frac_hyd, K2O_Liq_mol_frac_hyd):
@@ -830,33 +1001,33 @@ K_Amp_cat_23ox, Ca_Amp_cat_23ox, Na2O_Liq_mol_frac_hyd, K2O_Liq_mol_frac_hyd):
 
     '''
     NaM4_1=2-Fet_Amp_cat_23ox-Ca_Amp_cat_23ox
-    NaM4=np.empty(len(NaM4_1))
-    for i in range(0, len(NaM4)):
-        if NaM4_1[i]<=0.1:
-            NaM4[i]=0
-        else:
-            NaM4[i]=NaM4_1[i]
+    NaM4=np.where(NaM4_1<=0.1, 0, NaM4_1)
 
     HelzA=Na_Amp_cat_23ox-NaM4
-    ln_KD_Na_K=np.log((K_Amp_cat_23ox.astype(float)/HelzA.astype(float))*(Na2O_Liq_mol_frac_hyd.astype(float)/K2O_Liq_mol_frac_hyd.astype(float)))
+    ln_KD_Na_K=np.log((_as_float(K_Amp_cat_23ox)/_as_float(HelzA))*(_as_float(Na2O_Liq_mol_frac_hyd)/_as_float(K2O_Liq_mol_frac_hyd)))
 
     return (273.15+(10073.5/(9.75+0.934*Si_Amp_cat_23ox-1.454*Ti_Amp_cat_23ox
-    -0.882*Mg_Amp_cat_23ox-1.123*Na_Amp_cat_23ox-0.322*np.log(FeOt_Liq_mol_frac_hyd.astype(float))
-    -0.7593*np.log(Al_Amp_cat_23ox.astype(float)/Al2O3_Liq_mol_frac_hyd.astype(float))-0.15*ln_KD_Na_K)))
+    -0.882*Mg_Amp_cat_23ox-1.123*Na_Amp_cat_23ox-0.322*np.log(_as_float(FeOt_Liq_mol_frac_hyd))
+    -0.7593*np.log(_as_float(Al_Amp_cat_23ox)/_as_float(Al2O3_Liq_mol_frac_hyd))-0.15*ln_KD_Na_K)))
 
 
 
 ## Function: Amphibole-only temperature
 
+# T_Put2016_eq4a_amp_sat needs liquid compositions, so is in Amp_Liq_T_funcs instead
 Amp_only_T_funcs = {T_Put2016_eq5, T_Put2016_eq6, T_Put2016_SiHbl, T_Put2016_eq8,
- T_Ridolfi2012, T_Put2016_eq4a_amp_sat, T_Put2016_eq8} # put on outside
+ T_Ridolfi2012} # put on outside
 
 Amp_only_T_funcs_by_name= {p.__name__: p for p in Amp_only_T_funcs}
 
+_AMP_ONLY_T_KWARGS = {name: _kwonly_params(f) for name, f in Amp_only_T_funcs_by_name.items()}
+_AMP_ONLY_T_P_REQUIRED = {name: inspect.signature(f).parameters['P'].default is not None
+for name, f in Amp_only_T_funcs_by_name.items()}
+
 
 
 
-def calculate_amp_only_temp(amp_comps, equationT, P=None):
+def calculate_amp_only_temp(amp_comps, equationT, P=None, dtype=None):
     '''
     Amphibole-only thermometry, calculates temperature in Kelvin.
 
@@ -879,6 +1050,11 @@ def calculate_amp_only_temp(amp_comps, equationT, P=None):
         If enter P="Solve", returns a partial function
         Else, enter an integer, float, or panda series
 
+    dtype: numpy dtype, optional
+        e.g. np.float32, to evaluate the equation at lower precision, which
+        is faster for large datasets. By default, uses the precision of the
+        calculated cation fractions (float64).
+
     Returns
     -------
     pandas.Series: Pressure in kbar (if eq_tests=False)
@@ -888,9 +1064,8 @@ def calculate_amp_only_temp(amp_comps, equationT, P=None):
         func = Amp_only_T_funcs_by_name[equationT]
     except KeyError:
         raise ValueError(f'{equationT} is not a valid equation') from None
-    sig=inspect.signature(func)
 
-    if sig.parameters['P'].default is not None:
+    if _AMP_ONLY_T_P_REQUIRED[equationT]:
         if P is None:
             raise ValueError(f'{equationT} requires you to enter P, or specify P="Solve"')
     else:
@@ -908,21 +1083,20 @@ def calculate_amp_only_temp(amp_comps, equationT, P=None):
             raise Exception(
                 'You have selected a P-dependent thermometer, please enter an option for P')
         cat13 = calculate_13cations_amphibole_ridolfi(amp_comps)
-        myAmps1_label = amp_comps.drop(['Sample_ID_Amp'], axis='columns')
-        Sum_input = myAmps1_label.sum(axis='columns')
 
-        kwargs = {name: cat13[name] for name, p in inspect.signature(
-            T_Ridolfi2012).parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
+        kwargs = {name: cat13[name] for name in _AMP_ONLY_T_KWARGS[equationT]}
 
     else:
         amp_comps =calculate_23oxygens_amphibole(amp_comps=amp_comps)
-        kwargs = {name: amp_comps[name] for name, p in sig.parameters.items()
-        if p.kind == inspect.Parameter.KEYWORD_ONLY}
+        kwargs = {name: amp_comps[name] for name in _AMP_ONLY_T_KWARGS[equationT]}
+
+    if dtype is not None:
+        kwargs = {name: v.astype(dtype, copy=False) for name, v in kwargs.items()}
 
 
     if isinstance(P, str) or P is None:
         if P == "Solve":
-            T_K = partial(func, **kwargs)
+            T_K = partial(func, **_solve_kwargs(kwargs))
         if P is None:
             T_K=func(**kwargs)
 
@@ -934,6 +1108,29 @@ def calculate_amp_only_temp(amp_comps, equationT, P=None):
 
 ## Function: PT Iterate Amphibole - only
 
+def _iterate_PT(P_func, T_func, T_K_guess, iterations, T_tol=1e-6, P_tol=1e-7):
+    '''
+    Iterates the partial functions P_func (of T) and T_func (of P) to solve
+    for P and T, starting from T_K_guess. Stops after iterations, or once
+    T (K) and P (kbar) change by less than T_tol and P_tol in every row.
+    Returns P, T, and the change in P and T over the last iteration.
+    '''
+    P_guess = P_func(T_K_guess)
+    T_K_guess = T_func(P_guess)
+    DeltaP, DeltaT = 0, 0
+    for _ in range(iterations-1):
+        P_out_loop, T_out_loop = P_guess, T_K_guess
+        P_guess = P_func(T_K_guess)
+        T_K_guess = T_func(P_guess)
+        DeltaP=P_guess-np.asarray(P_out_loop)
+        DeltaT=T_K_guess-np.asarray(T_out_loop)
+        # Rows that are NaN never change, so don't hold up the others
+        if not (np.any(np.abs(DeltaT) >= T_tol) or np.any(np.abs(DeltaP) >= P_tol)):
+            break
+
+    return P_guess, T_K_guess, DeltaP, DeltaT
+
+
 def calculate_amp_only_press_temp(amp_comps, equationT, equationP, iterations=30,
 T_K_guess=1300, Ridolfi_Filter=True, return_amps=True, deltaNNO=None):
     '''
@@ -981,7 +1178,8 @@ T_K_guess=1300, Ridolfi_Filter=True, return_amps=True, deltaNNO=None):
     Optional:
 
      iterations: int, default=30
-         Number of iterations used to converge to solution.
+         Maximum number of iterations used to converge to solution. Stops
+         earlier once P and T stop changing.
 
      T_K_guess: int or float. Default is 1300 K
          Initial guess of temperature.
@@ -1023,19 +1221,8 @@ T_K_guess=1300, Ridolfi_Filter=True, return_amps=True, deltaNNO=None):
         P_guess = P_func
 
     if isinstance(P_func, partial) and isinstance(T_func, partial):
-
-        count=0
-        for _ in range(iterations):
-            P_guess = P_func(T_K_guess)
-            T_K_guess = T_func(P_guess)
-            if count==iterations-2:
-                # On the second last step, save the pressure
-                P_out_loop=P_guess.values
-                T_out_loop=T_K_guess.values
-            count=count+1
-
-        DeltaP=P_guess-P_out_loop
-        DeltaT=T_K_guess-T_out_loop
+        P_guess, T_K_guess, DeltaP, DeltaT = _iterate_PT(P_func, T_func,
+        T_K_guess, iterations)
 
 
     else:
@@ -1051,13 +1238,13 @@ T_K_guess=1300, Ridolfi_Filter=True, return_amps=True, deltaNNO=None):
          'classification': P_func_all['classification'],
          'equation': P_func_all['equation']
 
-         })
+         }, index=amp_comps.index)
 
     else:
         PT_out = pd.DataFrame(data={'P_kbar_calc': P_guess,
                                     'T_K_calc': T_K_guess,
                                     'Delta_P_kbar_Iter': DeltaP,
-                                    'Delta_T_K_Iter': DeltaT})
+                                    'Delta_T_K_Iter': DeltaT}, index=amp_comps.index)
     if return_amps is True:
         PT_out2=pd.concat([PT_out, amp_comps], axis=1)
         return PT_out2
@@ -1065,14 +1252,30 @@ T_K_guess=1300, Ridolfi_Filter=True, return_amps=True, deltaNNO=None):
         return PT_out
 
 ## Function: Amphibole-Liquid barometer
+
+def _amp_liq_Kd_eq_test(amp_comps, liq_comps_hy):
+    '''
+    Returns the Fe-Mg Kd between amphibole and liquid, and "Yes"/"No" for
+    whether it is within the equilibrium range (0.28+-0.11) of Putirka (2016)
+    '''
+    MolProp=calculate_mol_proportions_amphibole(amp_comps=amp_comps)
+    Kd=((MolProp['FeOt_Amp_mol_prop']/MolProp['MgO_Amp_mol_prop'])/
+    (liq_comps_hy['FeOt_Liq_mol_frac_hyd']/liq_comps_hy['MgO_Liq_mol_frac_hyd']))
+    Kd_np=Kd.to_numpy(dtype=float)
+    return Kd, np.where((Kd_np >= 0.17) & (Kd_np <= 0.39), "Yes", "No")
+
 Amp_Liq_P_funcs = {P_Put2016_eq7a, P_Put2016_eq7b, P_Put2016_eq7c}
 
 Amp_Liq_P_funcs_by_name = {p.__name__: p for p in Amp_Liq_P_funcs}
 
+_AMP_LIQ_P_KWARGS = {name: _kwonly_params(f) for name, f in Amp_Liq_P_funcs_by_name.items()}
+_AMP_LIQ_P_T_REQUIRED = {name: inspect.signature(f).parameters['T'].default is not None
+for name, f in Amp_Liq_P_funcs_by_name.items()}
+
 
 def calculate_amp_liq_press(*, amp_comps=None, liq_comps=None,
                             meltmatch=None, equationP=None, T=None,
-                             eq_tests=False, H2O_Liq=None):
+                             eq_tests=False, H2O_Liq=None, dtype=None):
     '''
     Amphibole-liquid barometer. Returns pressure in kbar
 
@@ -1101,6 +1304,11 @@ def calculate_amp_liq_press(*, amp_comps=None, liq_comps=None,
         If True, also calcualtes Kd Fe-Mg, which Putirka (2016) suggest
         as an equilibrium test.
 
+    dtype: numpy dtype, optional
+        e.g. np.float32, to evaluate the equation at lower precision, which
+        is faster for large datasets. By default, uses the precision of the
+        calculated cation fractions (float64).
+
 
     Returns
     -------
@@ -1116,12 +1324,11 @@ def calculate_amp_liq_press(*, amp_comps=None, liq_comps=None,
         func = Amp_Liq_P_funcs_by_name[equationP]
     except KeyError:
         raise ValueError(f'{equationP} is not a valid equation') from None
-    sig=inspect.signature(func)
 
     if equationP == "P_Put2016_eq7a" and meltmatch is None:
         w.warn('Note - Putirka 2016 spreadsheet calculates H2O using a H2O-solubility law of uncertian origin based on the pressure calculated for 7a, and iterates H2O and P. We dont do this, as we dont believe a pure h2o model is necessarily valid as you may be mixed fluid saturated or undersaturated. We recomend instead you choose a reasonable H2O content based on your system.')
 
-    if sig.parameters['T'].default is not None:
+    if _AMP_LIQ_P_T_REQUIRED[equationP]:
         if T is None:
             raise ValueError(f'{equationP} requires you to enter T, or specify T="Solve"')
     else:
@@ -1135,10 +1342,12 @@ def calculate_amp_liq_press(*, amp_comps=None, liq_comps=None,
 
 
     if meltmatch is not None:
-        Combo_liq_amps = meltmatch
+        Combo_liq_amps = (meltmatch,)
     if meltmatch is None:
-        liq_comps_c = liq_comps.copy()
+        # Only copied if H2O needs overwriting, the cation fraction functions don't modify it
+        liq_comps_c = liq_comps
         if H2O_Liq is not None:
+            liq_comps_c = liq_comps.copy()
             liq_comps_c['H2O_Liq'] = H2O_Liq
 
         amp_comps_23 = calculate_23oxygens_amphibole(amp_comps=amp_comps)
@@ -1146,14 +1355,16 @@ def calculate_amp_liq_press(*, amp_comps=None, liq_comps=None,
             liq_comps=liq_comps_c)
         liq_comps_an = calculate_anhydrous_cat_fractions_liquid(
             liq_comps=liq_comps_c)
-        Combo_liq_amps = pd.concat(
-            [amp_comps_23, liq_comps_hy, liq_comps_an], axis=1)
+        Combo_liq_amps = (amp_comps_23, liq_comps_hy, liq_comps_an)
 
+    kwargs = {name: _first_column(Combo_liq_amps, name)
+    for name in _AMP_LIQ_P_KWARGS[equationP]}
 
-    kwargs = {name: Combo_liq_amps[name] for name, p in sig.parameters.items() if p.kind == inspect.Parameter.KEYWORD_ONLY}
+    if dtype is not None:
+        kwargs = {name: v.astype(dtype, copy=False) for name, v in kwargs.items()}
     if isinstance(T, str) or T is None:
         if T == "Solve":
-            P_kbar = partial(func, **kwargs)
+            P_kbar = partial(func, **_solve_kwargs(kwargs))
         if T is None:
             P_kbar=func(**kwargs)
 
@@ -1163,16 +1374,7 @@ def calculate_amp_liq_press(*, amp_comps=None, liq_comps=None,
     if eq_tests is False:
         return P_kbar
     if eq_tests is True:
-        MolProp=calculate_mol_proportions_amphibole(amp_comps=amp_comps)
-        Kd=(MolProp['FeOt_Amp_mol_prop']/MolProp['MgO_Amp_mol_prop'])/(liq_comps_hy['FeOt_Liq_mol_frac_hyd']/liq_comps_hy['MgO_Liq_mol_frac_hyd'])
-
-        b = np.empty(len(MolProp), dtype=str)
-        for i in range(0, len(MolProp)):
-
-            if Kd[i] >= 0.17 and Kd[i] <= 0.39:
-                b[i] = str("Yes")
-            else:
-                b[i] = str("No")
+        Kd, b = _amp_liq_Kd_eq_test(amp_comps, liq_comps_hy)
         Out=pd.DataFrame(data={'P_kbar_calc': P_kbar, 'Kd-Fe-Mg': Kd, "Eq Putirka 2016?": b})
     return Out
 ## Function: Amp-Liq temp
@@ -1181,8 +1383,12 @@ Amp_Liq_T_funcs = {T_Put2016_eq4b,  T_Put2016_eq4a_amp_sat, T_Put2016_eq9}
 
 Amp_Liq_T_funcs_by_name = {p.__name__: p for p in Amp_Liq_T_funcs}
 
+_AMP_LIQ_T_KWARGS = {name: _kwonly_params(f) for name, f in Amp_Liq_T_funcs_by_name.items()}
+_AMP_LIQ_T_P_REQUIRED = {name: inspect.signature(f).parameters['P'].default is not None
+for name, f in Amp_Liq_T_funcs_by_name.items()}
+
 def calculate_amp_liq_temp(*, amp_comps=None, liq_comps=None, meltmatch=None, equationT=None,
-P=None, H2O_Liq=None, eq_tests=False):
+P=None, H2O_Liq=None, eq_tests=False, dtype=None):
     '''
     Amphibole-liquid thermometers. Returns temperature in Kelvin.
 
@@ -1210,6 +1416,11 @@ P=None, H2O_Liq=None, eq_tests=False):
         If True, also calcualtes Kd Fe-Mg, which Putirka (2016) suggest
         as an equilibrium test.
 
+    dtype: numpy dtype, optional
+        e.g. np.float32, to evaluate the equation at lower precision, which
+        is faster for large datasets. By default, uses the precision of the
+        calculated cation fractions (float64).
+
 
     Returns
     -------
@@ -1224,9 +1435,8 @@ P=None, H2O_Liq=None, eq_tests=False):
         func = Amp_Liq_T_funcs_by_name[equationT]
     except KeyError:
         raise ValueError(f'{equationT} is not a valid equation') from None
-    sig=inspect.signature(func)
 
-    if sig.parameters['P'].default is not None:
+    if _AMP_LIQ_T_P_REQUIRED[equationT]:
         if P is None:
             raise ValueError(f'{equationT} requires you to enter P, or specify P="Solve"')
     else:
@@ -1239,25 +1449,29 @@ P=None, H2O_Liq=None, eq_tests=False):
                 raise ValueError('The panda series entered for Pressure isnt the same length as the dataframe of liquid compositions')
 
     if meltmatch is not None:
-        Combo_liq_amps=meltmatch
+        Combo_liq_amps=(meltmatch,)
     if meltmatch is None:
-        liq_comps_c = liq_comps.copy()
+        # Only copied if H2O needs overwriting, the cation fraction functions don't modify it
+        liq_comps_c = liq_comps
         if H2O_Liq is not None:
+            liq_comps_c = liq_comps.copy()
             liq_comps_c['H2O_Liq'] = H2O_Liq
 
         amp_comps_23 = calculate_23oxygens_amphibole(amp_comps=amp_comps)
         liq_comps_hy = calculate_hydrous_cat_fractions_liquid(liq_comps=liq_comps_c)
         liq_comps_an = calculate_anhydrous_cat_fractions_liquid(liq_comps=liq_comps_c)
-        Combo_liq_amps = pd.concat([amp_comps_23, liq_comps_hy, liq_comps_an], axis=1)
+        Combo_liq_amps = (amp_comps_23, liq_comps_hy, liq_comps_an)
 
+    kwargs = {name: _first_column(Combo_liq_amps, name)
+    for name in _AMP_LIQ_T_KWARGS[equationT]}
 
-    kwargs = {name: Combo_liq_amps[name] for name, p in sig.parameters.items()
-    if p.kind == inspect.Parameter.KEYWORD_ONLY}
+    if dtype is not None:
+        kwargs = {name: v.astype(dtype, copy=False) for name, v in kwargs.items()}
 
 
     if isinstance(P, str) or P is None:
         if P == "Solve":
-            T_K = partial(func, **kwargs)
+            T_K = partial(func, **_solve_kwargs(kwargs))
         if P is None:
             T_K=func(**kwargs)
 
@@ -1268,17 +1482,7 @@ P=None, H2O_Liq=None, eq_tests=False):
     if eq_tests is False:
         return T_K
     if eq_tests is True:
-        MolProp=calculate_mol_proportions_amphibole(amp_comps=amp_comps)
-        Kd=((MolProp['FeOt_Amp_mol_prop']/MolProp['MgO_Amp_mol_prop'])/
-        (liq_comps_hy['FeOt_Liq_mol_frac_hyd']/liq_comps_hy['MgO_Liq_mol_frac_hyd']))
-
-        b = np.empty(len(MolProp), dtype=str)
-        for i in range(0, len(MolProp)):
-
-            if Kd[i] >= 0.17 and Kd[i] <= 0.39:
-                b[i] = str("Yes")
-            else:
-                b[i] = str("No")
+        Kd, b = _amp_liq_Kd_eq_test(amp_comps, liq_comps_hy)
         Out=pd.DataFrame(data={'T_K_calc': T_K, 'Kd-Fe-Mg': Kd, "Eq Putirka 2016?": b})
     return Out
 
@@ -1315,7 +1519,8 @@ T_K_guess=1300, H2O_Liq=None, eq_tests=False):
     Optional:
 
     iterations: int, default=30
-         Number of iterations used to converge to solution.
+         Maximum number of iterations used to converge to solution. Stops
+         earlier once P and T stop changing.
 
     T_K_guess: int or float. Default is 1300 K
          Initial guess of temperature.
@@ -1336,9 +1541,10 @@ T_K_guess=1300, H2O_Liq=None, eq_tests=False):
 
     if meltmatch is None:
 
-        liq_comps_c=liq_comps.copy()
+        liq_comps_c=liq_comps
 
         if H2O_Liq is not None:
+            liq_comps_c=liq_comps.copy()
             liq_comps_c['H2O_Liq']=H2O_Liq
 
         T_func = calculate_amp_liq_temp(liq_comps=liq_comps_c,
@@ -1365,19 +1571,8 @@ T_K_guess=1300, H2O_Liq=None, eq_tests=False):
         P_guess = P_func
 
     if isinstance(P_func, partial) and isinstance(T_func, partial):
-
-        count=0
-        for _ in range(iterations):
-            P_guess = P_func(T_K_guess)
-            T_K_guess = T_func(P_guess)
-            if count==iterations-2:
-                # On the second last step, save the pressure
-                P_out_loop=P_guess.values
-                T_out_loop=T_K_guess.values
-            count=count+1
-
-        DeltaP=P_guess-P_out_loop
-        DeltaT=T_K_guess-T_out_loop
+        P_guess, T_K_guess, DeltaP, DeltaT = _iterate_PT(P_func, T_func,
+        T_K_guess, iterations)
 
 
     else:
@@ -1387,25 +1582,16 @@ T_K_guess=1300, H2O_Liq=None, eq_tests=False):
     PT_out = pd.DataFrame(data={'P_kbar_calc': P_guess,
                                 'T_K_calc': T_K_guess,
                                 'Delta_P_kbar_Iter': DeltaP,
-                                'Delta_T_K_Iter': DeltaT})
+                                'Delta_T_K_Iter': DeltaT},
+                                index=amp_comps.index if meltmatch is None else meltmatch.index)
 
     if eq_tests is False:
         return PT_out
     if eq_tests is True:
         liq_comps_hy = calculate_hydrous_cat_fractions_liquid(
             liq_comps=liq_comps_c)
-        MolProp=calculate_mol_proportions_amphibole(amp_comps=amp_comps)
-        Kd=(MolProp['FeOt_Amp_mol_prop']/MolProp['MgO_Amp_mol_prop'])/(liq_comps_hy['FeOt_Liq_mol_frac_hyd']/liq_comps_hy['MgO_Liq_mol_frac_hyd'])
+        Kd, b = _amp_liq_Kd_eq_test(amp_comps, liq_comps_hy)
         PT_out['Kd-Fe-Mg']=Kd
-
-        b = np.empty(len(MolProp), dtype=str)
-        for i in range(0, len(MolProp)):
-
-            if Kd[i] >= 0.17 and Kd[i] <= 0.39:
-                b[i] = str("Yes")
-            else:
-                b[i] = str("No")
-
         PT_out["Eq Putirka 2016?"]=b
 
     return PT_out
@@ -2329,6 +2329,11 @@ def calculate_13cations_amphibole_ridolfi(amp_comps):
     cat_13_out = pd.concat([cats, cation_13_noox], axis=1)
     return cat_13_out
 
+# Charge of each cation, used to work out Fe3 in calculate_sites_ridolfi
+_RIDOLFI_CHARGES = {'Si_Amp_13_cat': 4, 'Ti_Amp_13_cat': 4, 'Al_Amp_13_cat': 3,
+'Cr_Amp_13_cat': 3, 'Fet_Amp_13_cat': 2, 'Mn_Amp_13_cat': 2, 'Mg_Amp_13_cat': 2,
+'Ca_Amp_13_cat': 2, 'Na_Amp_13_cat': 1, 'K_Amp_13_cat': 1}
+
 def calculate_sites_ridolfi(amp_comps):
 
     amp_comps_c=amp_comps.copy()
@@ -2373,9 +2378,9 @@ def calculate_sites_ridolfi(amp_comps):
     norm_cations['Cr_C']=norm_cations['Cr_Amp_13_cat']
 
     # Calculate charge for Fe
-    norm_cations['Charge']=(norm_cations['Si_Amp_13_cat']*4+norm_cations['Ti_Amp_13_cat']*4+norm_cations['Al_Amp_13_cat']*3+
-    norm_cations['Cr_Amp_13_cat']*3+norm_cations['Fet_Amp_13_cat']*2+norm_cations['Mn_Amp_13_cat']*2+norm_cations['Mg_Amp_13_cat']*2
-    +norm_cations['Ca_Amp_13_cat']*2+norm_cations['Na_Amp_13_cat']+norm_cations['K_Amp_13_cat'])
+    Charge=norm_cations[list(_RIDOLFI_CHARGES)].to_numpy(dtype=float) @ np.fromiter(
+    _RIDOLFI_CHARGES.values(), dtype=float)
+    norm_cations['Charge']=Charge
 
     # If DG2 (charge)>46, set Fe3 to zero, else set to 46-charge
     norm_cations['Fe3_C']=46-norm_cations['Charge']
@@ -2398,104 +2403,88 @@ def calculate_sites_ridolfi(amp_comps):
 
     # All Na left after B
     norm_cations['Na_A']=norm_cations['Na_Amp_13_cat']-norm_cations['Na_B']
-    if "Sample_ID_Amp" in amp_comps.columns:
-        myAmps1_label = amp_comps_c.drop(['Sample_ID_Amp'], axis='columns')
-    else:
-        myAmps1_label = amp_comps_c
-    norm_cations['Sum_input'] = myAmps1_label.sum(axis='columns')
+    # Only sum the oxides Ridolfi uses, so sample names and other metadata columns are ignored
+    norm_cations['Sum_input'] = amp_comps_c.reindex(oxide_mass_amp_df_Ridolfi.columns,
+    axis=1).fillna(0).to_numpy(dtype=float).sum(axis=1)
     Sum_input=norm_cations['Sum_input']
     Low_sum=norm_cations['Sum_input'] <90
 
-   # Other checks in Ridolfi's spreadsheet
-    norm_cations['H2O_calc']=(2-norm_cations['F_Amp_13_cat']-norm_cations['Cl_Amp_13_cat'])*norm_cations['cation_sum_Si_Mg']*17/13/2
-    norm_cations.loc[(Low_sum), 'H2O_calc']=0
-
-    norm_cations['Charge']=(norm_cations['Si_Amp_13_cat']*4+norm_cations['Ti_Amp_13_cat']*4+norm_cations['Al_Amp_13_cat']*3+
-    norm_cations['Cr_Amp_13_cat']*3+norm_cations['Fet_Amp_13_cat']*2+norm_cations['Mn_Amp_13_cat']*2+norm_cations['Mg_Amp_13_cat']*2
-    +norm_cations['Ca_Amp_13_cat']*2+norm_cations['Na_Amp_13_cat']+norm_cations['K_Amp_13_cat'])
-
-    norm_cations['Fe3_calc']=46-norm_cations['Charge']
-    High_Charge=norm_cations['Charge']>46
-    norm_cations.loc[(High_Charge), 'Fe3_calc']=0
-
-    norm_cations['Fe2_calc']=norm_cations['Fet_Amp_13_cat']-norm_cations['Fe3_calc']
-
-
-    norm_cations['Fe2O3_calc']=norm_cations['Fe3_calc']*norm_cations['cation_sum_Si_Mg']*159.691/13/2
-    norm_cations.loc[(Low_sum), 'Fe2O3_calc']=0
-
-    norm_cations['FeO_calc']=norm_cations['Fe2_calc']*norm_cations['cation_sum_Si_Mg']*71.846/13
-    norm_cations.loc[(Low_sum), 'Fe2O3_calc']=0
-
-    norm_cations['O=F,Cl']=-(amp_comps_c['F_Amp']*0.421070639014633+amp_comps_c['Cl_Amp']*0.225636758525372)
-    norm_cations.loc[(Low_sum), 'O=F,Cl']=0
-
-    norm_cations['Total_recalc']=(Sum_input-amp_comps_c['FeOt_Amp']+norm_cations['H2O_calc']+norm_cations['Fe2O3_calc']
-    +norm_cations['FeO_calc']+norm_cations['O=F,Cl'])
-    norm_cations.loc[(Low_sum), 'Total']=0
-
-    # Set up a column for a fail message
-    norm_cations['Fail Msg']=""
-    norm_cations['Input_Check']=True
-
-    # Check that old total isn't <90
-
-    norm_cations.loc[(Low_sum), 'Input_Check']=False
-    norm_cations.loc[(Low_sum), 'Fail Msg']="Cation oxide Total<90"
-
-    # First check, that new total is >98.5 (e.g with recalculated H2O etc).
-
-    Low_total_Recalc=norm_cations['Total_recalc']<98.5
-    norm_cations.loc[(Low_total_Recalc), 'Input_Check']=False
-    norm_cations.loc[(Low_total_Recalc), 'Fail Msg']="Recalc Total<98.5"
-
-    # Next, check that new total isn't >102
-    High_total_Recalc=norm_cations['Total_recalc']>102
-    norm_cations.loc[(High_total_Recalc), 'Input_Check']=False
-    norm_cations.loc[(High_total_Recalc), 'Fail Msg']="Recalc Total>102"
-
-    # Next, check that charge isn't >46.5 ("unbalanced")
-    Unbalanced_Charge=norm_cations['Charge']>46.5
-    norm_cations.loc[(Unbalanced_Charge), 'Input_Check']=False
-    norm_cations.loc[(Unbalanced_Charge), 'Fail Msg']="unbalanced charge (>46.5)"
-
-    # Next check that Fe2+ is greater than 0, else unbalanced
-    Negative_Fe2=norm_cations['Fe2_calc']<0
-    norm_cations.loc[(Negative_Fe2), 'Input_Check']=False
-    norm_cations.loc[(Negative_Fe2), 'Fail Msg']="unbalanced charge (Fe2<0)"
-
-    # Check that Mg# calculated using just Fe2 is >54, else low Mg
-    norm_cations['Mgno_Fe2']=norm_cations['Mg_Amp_13_cat']/(norm_cations['Mg_Amp_13_cat']+norm_cations['Fe2_calc'])
-    norm_cations['Mgno_FeT']=norm_cations['Mg_Amp_13_cat']/(norm_cations['Mg_Amp_13_cat']+norm_cations['Fet_Amp_13_cat'])
-
-    Low_Mgno=100*norm_cations['Mgno_Fe2']<54
-    norm_cations.loc[(Low_Mgno), 'Input_Check']=False
-    norm_cations.loc[(Low_Mgno), 'Fail Msg']="Low Mg# (<54)"
-
-    #Only ones that matter are low Ca, high Ca, BJ3>60, low B cations"
-
-
-
-    # If Column CU<1.5,"low Ca"
-    Ca_low=norm_cations['Ca_Amp_13_cat']<1.5
-    norm_cations.loc[(Ca_low), 'Input_Check']=False
-    norm_cations.loc[(Ca_low), 'Fail Msg']="Low Ca (<1.5)"
-
-    # If Column CU>2.05, "high Ca"
-    Ca_high=norm_cations['Ca_Amp_13_cat']>2.05
-    norm_cations.loc[(Ca_high), 'Input_Check']=False
-    norm_cations.loc[(Ca_high), 'Fail Msg']="High Ca (>2.05)"
-
-    # Check that CW<1.99, else "Low B cations"
-    norm_cations['Na_calc']=2-norm_cations['Ca_Amp_13_cat']
-    Ca_greaterthanNa=norm_cations['Na_Amp_13_cat']<(2-norm_cations['Ca_Amp_13_cat'])
-    norm_cations.loc[(Ca_greaterthanNa), 'Na_calc']=norm_cations['Na_Amp_13_cat']
-    norm_cations['B_Sum']=norm_cations['Na_calc']+norm_cations['Ca_Amp_13_cat']
-
-
-    Low_B_Cations=norm_cations['B_Sum']<1.99
-    norm_cations.loc[(Low_B_Cations), 'Input_Check']=False
-    norm_cations.loc[(Low_B_Cations), 'Fail Msg']="Low B Cations"
+   # Other checks in Ridolfi's spreadsheet, worked out on arrays, as each
+   # cation column is used several times
+    Low_sum=Low_sum.to_numpy()
+    Sum_input=Sum_input.to_numpy()
+    Fet_13, Mg_13, Ca_13, Na_13, F_13, Cl_13, cat_sum = (
+        norm_cations[col].to_numpy(dtype=float) for col in ('Fet_Amp_13_cat',
+        'Mg_Amp_13_cat', 'Ca_Amp_13_cat', 'Na_Amp_13_cat', 'F_Amp_13_cat',
+        'Cl_Amp_13_cat', 'cation_sum_Si_Mg'))
+
+    H2O_calc=np.where(Low_sum, 0, (2-F_13-Cl_13)*cat_sum*17/13/2)
+
+    Fe3_calc=np.where(Charge>46, 0, 46-Charge)
+    Fe2_calc=Fet_13-Fe3_calc
+
+    Fe2O3_calc=np.where(Low_sum, 0, Fe3_calc*cat_sum*159.691/13/2)
+    FeO_calc=Fe2_calc*cat_sum*71.846/13
+
+    O_F_Cl=np.where(Low_sum, 0, -(amp_comps_c['F_Amp'].to_numpy(dtype=float)*0.421070639014633
+    +amp_comps_c['Cl_Amp'].to_numpy(dtype=float)*0.225636758525372))
+
+    Total_recalc=(Sum_input-amp_comps_c['FeOt_Amp'].to_numpy(dtype=float)+H2O_calc+Fe2O3_calc
+    +FeO_calc+O_F_Cl)
+
+    norm_cations['H2O_calc']=H2O_calc
+    norm_cations['Fe3_calc']=Fe3_calc
+    norm_cations['Fe2_calc']=Fe2_calc
+    norm_cations['Fe2O3_calc']=Fe2O3_calc
+    norm_cations['FeO_calc']=FeO_calc
+    norm_cations['O=F,Cl']=O_F_Cl
+    norm_cations['Total_recalc']=Total_recalc
+    norm_cations['Total']=np.where(Low_sum, 0, np.nan)
+
+    # Mg# calculated using just Fe2, and total Fe
+    Mgno_Fe2=Mg_13/(Mg_13+Fe2_calc)
+    Mgno_FeT=Mg_13/(Mg_13+Fet_13)
+
+    # B site cations, Na is 2-Ca unless there is less Na than that
+    Na_calc=np.where(Na_13<(2-Ca_13), Na_13, 2-Ca_13)
+    B_Sum=Na_calc+Ca_13
+
+    # Checks in Ridolfi's spreadsheet. Listed in the order they are applied,
+    # so if several fail, the fail message is that of the last one.
+    Checks=[
+        # First check, that new total is >98.5 (e.g with recalculated H2O etc).
+        (Total_recalc<98.5, "Recalc Total<98.5"),
+        # Next, check that new total isn't >102
+        (Total_recalc>102, "Recalc Total>102"),
+        # Next, check that charge isn't >46.5 ("unbalanced")
+        (Charge>46.5, "unbalanced charge (>46.5)"),
+        # Next check that Fe2+ is greater than 0, else unbalanced
+        (Fe2_calc<0, "unbalanced charge (Fe2<0)"),
+        # Check that Mg# calculated using just Fe2 is >54, else low Mg
+        (100*Mgno_Fe2<54, "Low Mg# (<54)"),
+        #Only ones that matter are low Ca, high Ca, BJ3>60, low B cations"
+        # If Column CU<1.5,"low Ca"
+        (Ca_13<1.5, "Low Ca (<1.5)"),
+        # If Column CU>2.05, "high Ca"
+        (Ca_13>2.05, "High Ca (>2.05)"),
+        # Check that CW<1.99, else "Low B cations"
+        (B_Sum<1.99, "Low B Cations"),
+        # Applied last, as these rows also fail the recalculated total, and
+        # a low input total is why the Ridolfi 2021 barometer skips them
+        (Low_sum, "Cation oxide Total<90"),
+    ]
+    Failed=[check for check, msg in reversed(Checks)]
+    # Stored as a categorical, as there are only a handful of messages.
+    # "APE >60" is added by the Ridolfi 2021 barometer
+    Fail_codes=np.select(Failed, np.arange(len(Checks), 0, -1), default=0).astype(np.int8)
+    norm_cations['Fail Msg']=pd.Categorical.from_codes(Fail_codes,
+    categories=[""] + [msg for check, msg in Checks] + ["APE >60"])
+    norm_cations['Input_Check']=~np.any(Failed, axis=0)
+
+    norm_cations['Mgno_Fe2']=Mgno_Fe2
+    norm_cations['Mgno_FeT']=Mgno_FeT
+    norm_cations['Na_calc']=Na_calc
+    norm_cations['B_Sum']=B_Sum
 
     # Printing composition
     norm_cations['A_Sum']=norm_cations['Na_A']+norm_cations['K_A']